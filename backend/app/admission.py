@@ -0,0 +1,280 @@
+"""
+Admission control and load shedding for the API.
+
+Requests are sorted into route classes by estimated cost. Each class has its
+own concurrency limit, so a burst of expensive queries can only occupy the
+expensive slots and never starves cheap lookups or health checks. A request
+that cannot get a slot before the queue deadline is shed with a 503.
+
+Expensive routes are plain `def` handlers, which FastAPI runs in its thread
+pool. The event loop stays free to accept and queue further requests while
+they work, so the expensive limit is what actually bounds their concurrency.
+"""
+import asyncio
+import json
+import math
+from typing import Optional
+from urllib.parse import parse_qs
+
+from fastapi import FastAPI, Request, status
+from pydantic import BaseModel, Field
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import settings
+
+# Route classes
+CHEAP = "cheap"
+EXPENSIVE = "expensive"
+
+# Paths that are never limited: health checks must always answer, and event
+# streams are long-lived by design
+EXEMPT_PATHS = {
+    "/",
+    "/health",
+    "/health/admission",
+    "/health/events",
+    "/ready",
+    "/api/news/stream",
+}
+
+# List endpoints whose cost depends on their query parameters
+_QUERY_COSTED_PATHS = {"/api/news", "/api/news/facets"}
+
+# Returns every article in a category as a full ArticleDetail
+_CATEGORY_PATH_PREFIX = "/api/news/category/"
+
+
+def estimate_route_class(path: str, query_string: bytes) -> Optional[str]:
+    """
+    Estimate the cost class of a request from its path and query parameters.
+
+    Parameters are compared by their effective values, with absent ones
+    taking the route defaults, and mirror the work the routes actually do:
+
+    - `/api/news` sorted by publishedAt (the default) is cheap. Unfiltered
+      pages are sliced from the date index at any depth, tag and date
+      filters return matches already in date order, and the default first
+      pages are served from the hot response cache.
+    - `/api/news` sorted by any other field sorts every match, up to the
+      whole corpus, before slicing the page.
+    - A search query scans the title and summary of every candidate, on both
+      `/api/news` and `/api/news/facets`. Facets are otherwise counted from
+      posting lists.
+    - `/api/news/category/{name}` serializes every article in the category.
+    - Everything else is a single lookup or served from an index.
+
+    Args:
+        path: The request path.
+        query_string: The raw query string.
+
+    Returns:
+        The route class, or None if the request is exempt.
+    """
+    if path in EXEMPT_PATHS:
+        return None
+    if path.startswith(_CATEGORY_PATH_PREFIX):
+        return EXPENSIVE
+    if path not in _QUERY_COSTED_PATHS:
+        return CHEAP
+
+    params = parse_qs(query_string.decode("latin-1"))
+    if params.get("search", [""])[0]:
+        return EXPENSIVE
+    if path == "/api/news":
+        sort_by = params.get("sort_by", ["publishedAt"])[0]
+        if sort_by != "publishedAt":
+            return EXPENSIVE
+    return CHEAP
+
+
+class RouteClassStats(BaseModel):
+    """
+    Admission counters for a single route class.
+    """
+
+    limit: int = Field(..., description="Maximum concurrent requests")
+    in_flight: int = Field(..., description="Requests currently being served")
+    waiting: int = Field(..., description="Requests waiting for a slot")
+    admitted: int = Field(..., description="Requests admitted since startup")
+    shed: int = Field(..., description="Requests rejected with 503 since startup")
+
+
+class _RouteClassLimiter:
+    """
+    Concurrency limit with a bounded, deadline-limited wait queue.
+    """
+
+    def __init__(self, limit: int, max_queue: int) -> None:
+        self.limit = limit
+        self.max_queue = max_queue
+        self.semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.shed = 0
+
+    async def acquire(self, deadline: float) -> bool:
+        """
+        Wait for a slot until the deadline.
+
+        Returns:
+            True if a slot was acquired, False if the request should be shed.
+        """
+        if self.semaphore.locked() and self.waiting >= self.max_queue:
+            self.shed += 1
+            return False
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self.semaphore.acquire(), timeout=deadline)
+        except asyncio.TimeoutError:
+            self.shed += 1
+            return False
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        self.admitted += 1
+        return True
+
+    def release(self) -> None:
+        """
+        Release a previously acquired slot.
+        """
+        self.in_flight -= 1
+        self.semaphore.release()
+
+    def stats(self) -> RouteClassStats:
+        return RouteClassStats(
+            limit=self.limit,
+            in_flight=self.in_flight,
+            waiting=self.waiting,
+            admitted=self.admitted,
+            shed=self.shed,
+        )
+
+
+class AdmissionController:
+    """
+    Per-route-class limiters shared by every request in the worker.
+    """
+
+    def __init__(
+        self,
+        cheap_limit: int = settings.ADMISSION_CHEAP_CONCURRENCY,
+        expensive_limit: int = settings.ADMISSION_EXPENSIVE_CONCURRENCY,
+        max_queue: int = settings.ADMISSION_MAX_QUEUE,
+        queue_deadline: float = settings.ADMISSION_QUEUE_DEADLINE,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            cheap_limit: Concurrent requests allowed for cheap routes.
+            expensive_limit: Concurrent requests allowed for expensive routes.
+            max_queue: Requests allowed to wait per route class.
+            queue_deadline: Seconds a request may wait for a slot.
+        """
+        self.queue_deadline = queue_deadline
+        self._limiters = {
+            CHEAP: _RouteClassLimiter(cheap_limit, max_queue),
+            EXPENSIVE: _RouteClassLimiter(expensive_limit, max_queue),
+        }
+
+    def get_limiter(self, route_class: str) -> _RouteClassLimiter:
+        return self._limiters[route_class]
+
+    def get_stats(self) -> dict[str, RouteClassStats]:
+        """
+        Get admission counters for every route class.
+        """
+        return {name: limiter.stats() for name, limiter in self._limiters.items()}
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware that admits, queues, or sheds requests by route class.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = estimate_route_class(scope["path"], scope["query_string"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.controller.get_limiter(route_class)
+        if not await limiter.acquire(self.controller.queue_deadline):
+            await self._send_overloaded(scope, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def _send_overloaded(self, scope: Scope, send: Send) -> None:
+        """
+        Send a 503 in the same error format as the exception handlers.
+        """
+        body = json.dumps(
+            {
+                "error": {
+                    "message": "Server is overloaded, please retry later",
+                    "status_code": status.HTTP_503_SERVICE_UNAVAILABLE,
+                    "path": str(Request(scope).url),
+                }
+            }
+        ).encode("utf-8")
+        retry_after = max(1, math.ceil(self.controller.queue_deadline))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_503_SERVICE_UNAVAILABLE,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    (b"retry-after", str(retry_after).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+# Singleton instance shared by the middleware and the stats endpoint
+_admission_controller_instance: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    Get or create the singleton AdmissionController instance.
+
+    Returns:
+        The singleton AdmissionController instance.
+    """
+    global _admission_controller_instance
+    if _admission_controller_instance is None:
+        _admission_controller_instance = AdmissionController()
+    return _admission_controller_instance
+
+
+def init_admission_control(app: FastAPI) -> None:
+    """
+    Initialize admission control middleware if enabled.
+
+    Args:
+        app: The FastAPI application instance.
+    """
+    if not settings.ADMISSION_CONTROL_ENABLED:
+        return
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=get_admission_controller(),
+    )
@@ -37,6 +37,24 @@ class Settings(BaseSettings):
     ENABLE_COMPRESSION: bool = True
     COMPRESSION_MINIMUM_SIZE: int = 1000  # Minimum response size in bytes to compress
 
+    # Startup warm-up (load snapshot, build indexes, pre-render hot responses)
+    WARMUP_ENABLED: bool = True
+
+    # Snapshot reload and article event stream
+    SNAPSHOT_RELOAD_INTERVAL: float = 30.0  # Seconds between file checks (0 disables)
+    EVENT_QUEUE_SIZE: int = 100  # Pending events per stream client before eviction
+    EVENT_HEARTBEAT_INTERVAL: float = 15.0  # Seconds between keep-alive comments
+
+    # Admission control
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_CHEAP_CONCURRENCY: int = 64  # Concurrent lookups and indexed queries
+    ADMISSION_EXPENSIVE_CONCURRENCY: int = 4  # Concurrent searches and full sorts
+    ADMISSION_MAX_QUEUE: int = 100  # Requests allowed to wait per route class
+    ADMISSION_QUEUE_DEADLINE: float = 2.0  # Seconds to wait for a slot before 503
+
+    # Static export
+    STATIC_EXPORT_DIR: str = "static_export"
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
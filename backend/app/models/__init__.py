@@ -8,6 +8,13 @@ from app.models.article import (
     ArticlePaginationParams,
     ArticlePreview,
     ArticleDetail,
+    ArticleView,
+    BatchArticlesResponse,
+    FacetCount,
+    FacetsResponse,
+    NewArticlesEvent,
+    Suggestion,
+    SuggestResponse,
 )
 
 __all__ = [
@@ -17,5 +24,12 @@ __all__ = [
     "ArticlePaginationParams",
     "ArticlePreview",
     "ArticleDetail",
+    "ArticleView",
+    "BatchArticlesResponse",
+    "FacetCount",
+    "FacetsResponse",
+    "NewArticlesEvent",
+    "Suggestion",
+    "SuggestResponse",
 ]
 
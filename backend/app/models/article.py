@@ -3,7 +3,7 @@ Article models for data validation and serialization.
 """
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional, Union
 
 from pydantic import BaseModel, Field, HttpUrl, field_validator
 
@@ -23,6 +23,10 @@ class ArticleCategory(str, Enum):
     MOVIE = "Movie"
 
 
+# Shapes in which an article can be returned from list endpoints
+ArticleView = Literal["preview", "detail"]
+
+
 class Article(BaseModel):
     """
     Article model matching backend data schema from backend/app/data/articles.json
@@ -127,6 +131,15 @@ class ArticlePaginationParams(BaseModel):
     search: Optional[str] = Field(
         None, min_length=1, max_length=200, description="Search query"
     )
+    tag: Optional[list[str]] = Field(
+        None, description="Filter by tags (all must match)"
+    )
+    since: Optional[datetime] = Field(
+        None, description="Only articles published at or after this time"
+    )
+    until: Optional[datetime] = Field(
+        None, description="Only articles published at or before this time"
+    )
 
 
 class ArticlePreview(BaseModel):
@@ -143,6 +156,21 @@ class ArticlePreview(BaseModel):
     publishedAt: datetime = Field(..., description="Publication timestamp")
     tags: list[str] = Field(default_factory=list, description="List of article tags")
 
+    @classmethod
+    def from_article(cls, article: Article) -> "ArticlePreview":
+        """
+        Create an ArticlePreview from an Article.
+        """
+        return cls(
+            id=article.id,
+            title=article.title,
+            summary=article.summary,
+            imageUrl=article.imageUrl,
+            category=article.category,
+            publishedAt=article.publishedAt,
+            tags=article.tags,
+        )
+
 
 class ArticleDetail(Article):
     """
@@ -171,3 +199,103 @@ class ArticleDetail(Article):
             readingTime=reading_time,
         )
 
+
+class FacetCount(BaseModel):
+    """
+    Number of articles sharing a facet value (a category or a tag).
+    """
+
+    value: str = Field(..., description="Facet value (category or tag name)")
+    count: int = Field(..., ge=0, description="Number of matching articles")
+
+
+class FacetsResponse(BaseModel):
+    """
+    Response structure for the facets endpoint.
+    """
+
+    total: int = Field(..., ge=0, description="Number of articles in scope")
+    categories: list[FacetCount] = Field(
+        ..., description="Article counts per category"
+    )
+    tags: list[FacetCount] = Field(
+        ..., description="Most frequent tags, most frequent first"
+    )
+
+    class Config:
+        """Pydantic configuration"""
+
+        json_schema_extra = {
+            "example": {
+                "total": 100,
+                "categories": [{"value": "Anime", "count": 42}],
+                "tags": [{"value": "Skip and Loafer", "count": 3}],
+            }
+        }
+
+
+class Suggestion(BaseModel):
+    """
+    A single autocomplete suggestion.
+    """
+
+    text: str = Field(..., description="Suggested completion")
+    type: str = Field(..., description="Suggestion source (word or tag)")
+    count: int = Field(..., ge=1, description="Number of articles containing it")
+
+
+class SuggestResponse(BaseModel):
+    """
+    Response structure for the autocomplete endpoint.
+    """
+
+    query: str = Field(..., description="The prefix that was completed")
+    suggestions: list[Suggestion] = Field(
+        ..., description="Completions ranked by frequency, then recency"
+    )
+
+    class Config:
+        """Pydantic configuration"""
+
+        json_schema_extra = {
+            "example": {
+                "query": "ski",
+                "suggestions": [
+                    {"text": "Skip and Loafer", "type": "tag", "count": 3},
+                    {"text": "skip", "type": "word", "count": 3},
+                ],
+            }
+        }
+
+
+class NewArticlesEvent(BaseModel):
+    """
+    Payload of a server-sent event announcing newly published articles.
+    """
+
+    articles: list[ArticlePreview] = Field(
+        ..., description="Newly published articles, oldest first"
+    )
+
+
+class BatchArticlesResponse(BaseModel):
+    """
+    Response structure for the batch article lookup endpoint.
+    """
+
+    articles: list[Union[ArticleDetail, ArticlePreview]] = Field(
+        ..., description="Found articles, in request order"
+    )
+    missing: list[str] = Field(
+        default_factory=list, description="Requested IDs that were not found"
+    )
+
+    class Config:
+        """Pydantic configuration"""
+
+        json_schema_extra = {
+            "example": {
+                "articles": [],
+                "missing": ["999999"],
+            }
+        }
@@ -1,22 +1,54 @@
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-from app.models import ArticleDetail, ArticleCategory, ArticlesResponse
-from app.services import get_article_service
+from app.models import (
+    ArticleDetail,
+    ArticleCategory,
+    ArticlePreview,
+    ArticlesResponse,
+    ArticleView,
+    BatchArticlesResponse,
+    FacetsResponse,
+    SuggestResponse,
+)
+from app.config import settings
+from app.services import (
+    get_article_broadcaster,
+    get_article_service,
+    get_response_cache,
+)
+from app.services.article_events import chunk_backlog, format_articles_event
+from app.services.response_cache import (
+    CATEGORIES_URL,
+    LATEST_LIMIT,
+    LATEST_URL,
+    first_page_url,
+)
 
 router = APIRouter()
 
 
 @router.get("/news", response_model=ArticlesResponse)
-async def get_news(
+def get_news(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     category: Optional[ArticleCategory] = Query(None, description="Filter by category"),
     search: Optional[str] = Query(None, description="Search query"),
     sort_by: str = Query("publishedAt", description="Sort field"),
     sort_order: str = Query("desc", description="Sort order (asc/desc)"),
-) -> ArticlesResponse:
+    tag: Optional[list[str]] = Query(
+        None, description="Filter by tag (repeatable; all tags must match)"
+    ),
+    since: Optional[datetime] = Query(
+        None, description="Only articles published at or after this time"
+    ),
+    until: Optional[datetime] = Query(
+        None, description="Only articles published at or before this time"
+    ),
+) -> ArticlesResponse | Response:
     """
     Get paginated list of news articles with filtering and sorting.
     
@@ -26,8 +58,26 @@ async def get_news(
     - **search**: Optional search query (searches in title and summary)
     - **sort_by**: Field to sort by (publishedAt, title, category)
     - **sort_order**: Sort order (asc or desc)
+    - **tag**: Optional tag filter, repeat for several tags (e.g. `?tag=Anime&tag=Movie`)
+    - **since**: Optional start of the publication window (ISO 8601)
+    - **until**: Optional end of the publication window (ISO 8601)
     """
     service = get_article_service()
+
+    # The default first page, overall or per category, is pre-rendered
+    if (
+        page == 1
+        and limit == 20
+        and not search
+        and sort_by == "publishedAt"
+        and sort_order == "desc"
+        and not tag
+        and since is None
+        and until is None
+    ):
+        body = get_response_cache().get(service, first_page_url(category))
+        return Response(content=body, media_type="application/json")
+
     return service.get_articles(
         page=page,
         limit=limit,
@@ -35,25 +85,159 @@ async def get_news(
         search=search,
         sort_by=sort_by,
         sort_order=sort_order,
+        tags=tag,
+        since=since,
+        until=until,
     )
 
 
 @router.get("/news/latest", response_model=list[ArticleDetail])
 async def get_latest_news(
-    limit: int = Query(10, ge=1, le=50, description="Number of latest articles")
-) -> list[ArticleDetail]:
+    limit: int = Query(
+        LATEST_LIMIT, ge=1, le=50, description="Number of latest articles"
+    )
+) -> list[ArticleDetail] | Response:
     """
     Get the latest news articles.
     
     - **limit**: Maximum number of articles to return (max 50)
     """
     service = get_article_service()
+    if limit == LATEST_LIMIT:
+        body = get_response_cache().get(service, LATEST_URL)
+        return Response(content=body, media_type="application/json")
+
     articles = service.get_recent_articles(limit=limit)
     return [ArticleDetail.from_article(a) for a in articles]
 
 
+@router.get("/news/facets", response_model=FacetsResponse)
+def get_news_facets(
+    search: Optional[str] = Query(None, description="Search query"),
+    since: Optional[datetime] = Query(
+        None, description="Only count articles published at or after this time"
+    ),
+    until: Optional[datetime] = Query(
+        None, description="Only count articles published at or before this time"
+    ),
+    top_tags: int = Query(20, ge=1, le=100, description="Number of top tags"),
+) -> FacetsResponse:
+    """
+    Get article counts per category and the most frequent tags.
+    
+    - **search**: Optional search query to scope the counts
+    - **since**: Optional start of the publication window (ISO 8601)
+    - **until**: Optional end of the publication window (ISO 8601)
+    - **top_tags**: Number of tags to return (max 100)
+    """
+    service = get_article_service()
+    return service.get_facets(
+        search=search,
+        since=since,
+        until=until,
+        top_tags=top_tags,
+    )
+
+
+@router.get("/news/suggest", response_model=SuggestResponse)
+async def get_news_suggestions(
+    q: str = Query(..., min_length=1, max_length=100, description="Prefix to complete"),
+    limit: int = Query(8, ge=1, le=20, description="Maximum number of suggestions"),
+) -> SuggestResponse:
+    """
+    Get autocomplete suggestions from article title words and tags.
+    
+    - **q**: The text typed so far
+    - **limit**: Maximum number of suggestions to return (max 20)
+    """
+    service = get_article_service()
+    return service.get_suggestions(query=q, limit=limit)
+
+
+@router.get("/news/stream", response_class=StreamingResponse)
+async def stream_news(
+    request: Request,
+    since: Optional[datetime] = Query(
+        None, description="Replay articles published after this time first"
+    ),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """
+    Stream newly published articles as server-sent events.
+    
+    Each `articles` event carries previews of the new articles and uses the
+    newest publishedAt as its event id, so reconnecting clients resume where
+    they left off. Missed articles are replayed first, oldest first, in
+    events of about 50 articles each. Idle streams receive periodic
+    keep-alive comments.
+    
+    - **since**: Optional last-seen publication time to catch up from
+    - **Last-Event-ID**: Sent automatically by EventSource on reconnect
+    """
+    if last_event_id:
+        try:
+            since = datetime.fromisoformat(last_event_id)
+        except ValueError:
+            pass
+
+    service = get_article_service()
+    broadcaster = get_article_broadcaster()
+    backlog = (
+        service.get_articles_published_after(since) if since is not None else []
+    )
+    # Subscribe before the first yield so no event published meanwhile is lost
+    subscriber = broadcaster.subscribe()
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        try:
+            for chunk in chunk_backlog(backlog):
+                yield format_articles_event(chunk)
+            while not subscriber.evicted:
+                if await request.is_disconnected():
+                    break
+                event = await subscriber.next_event(
+                    timeout=settings.EVENT_HEARTBEAT_INTERVAL
+                )
+                yield event if event is not None else b": keep-alive\n\n"
+        finally:
+            broadcaster.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/news/batch", response_model=BatchArticlesResponse)
+async def get_news_batch(
+    id: list[str] = Query(
+        ..., min_length=1, max_length=100, description="Article IDs (max 100)"
+    ),
+    view: ArticleView = Query("preview", description="Response shape"),
+) -> BatchArticlesResponse:
+    """
+    Get several news articles by ID in a single request.
+    
+    - **id**: Article IDs, repeat for each article (e.g. `?id=650043&id=650027`)
+    - **view**: `preview` for card data or `detail` for full articles with computed fields
+    
+    IDs that do not exist are listed in `missing` instead of failing the request.
+    """
+    service = get_article_service()
+    articles, missing = service.get_articles_by_ids(id)
+    
+    items: list[ArticleDetail | ArticlePreview]
+    if view == "detail":
+        items = [ArticleDetail.from_article(a) for a in articles]
+    else:
+        items = [ArticlePreview.from_article(a) for a in articles]
+    
+    return BatchArticlesResponse(articles=items, missing=missing)
+
+
 @router.get("/news/category/{name}", response_model=list[ArticleDetail])
-async def get_news_by_category(name: str) -> list[ArticleDetail]:
+def get_news_by_category(name: str) -> list[ArticleDetail]:
     """
     Get all news articles in a specific category.
     
@@ -99,11 +283,32 @@ async def get_news_detail(id: str) -> ArticleDetail:
     return ArticleDetail.from_article(article)
 
 
+@router.get("/news/{id}/related", response_model=list[ArticlePreview])
+def get_related_news(
+    id: str,
+    limit: int = Query(5, ge=1, le=10, description="Number of related articles"),
+) -> list[ArticlePreview]:
+    """
+    Get articles related to a news article by shared tags and category.
+    
+    - **id**: The unique article identifier
+    - **limit**: Maximum number of related articles to return (max 10)
+    """
+    service = get_article_service()
+    articles = service.get_related_articles(id, limit=limit)
+    
+    if articles is None:
+        raise HTTPException(status_code=404, detail=f"Article {id} not found")
+    
+    return [ArticlePreview.from_article(a) for a in articles]
+
+
 @router.get("/categories", response_model=list[str])
-async def get_categories() -> list[str]:
+async def get_categories() -> Response:
     """
     Get list of all available article categories.
     """
     service = get_article_service()
-    return service.get_categories()
+    body = get_response_cache().get(service, CATEGORIES_URL)
+    return Response(content=body, media_type="application/json")
 
@@ -2,6 +2,25 @@
 Service layer for business logic.
 """
 from app.services.article_service import ArticleService, get_article_service
+from app.services.article_events import (
+    ArticleBroadcaster,
+    EventStreamStats,
+    get_article_broadcaster,
+    watch_snapshot,
+)
+from app.services.response_cache import ResponseCache, get_response_cache
+from app.services.warmup import WarmupReport, warm_up
 
-__all__ = ["ArticleService", "get_article_service"]
+__all__ = [
+    "ArticleService",
+    "get_article_service",
+    "ArticleBroadcaster",
+    "EventStreamStats",
+    "get_article_broadcaster",
+    "watch_snapshot",
+    "ResponseCache",
+    "get_response_cache",
+    "WarmupReport",
+    "warm_up",
+]
 
@@ -0,0 +1,238 @@
+"""
+Fan-out of newly published articles to server-sent event subscribers.
+"""
+import asyncio
+import logging
+from typing import Iterator, Optional
+
+from pydantic import BaseModel, Field
+
+from app.config import settings
+from app.models import Article, ArticlePreview, NewArticlesEvent
+from app.services.article_service import ArticleService
+
+logger = logging.getLogger(__name__)
+
+# Maximum articles per replayed backlog event
+BACKLOG_CHUNK_SIZE = 50
+
+
+def format_articles_event(articles: list[Article]) -> bytes:
+    """
+    Serialize articles into a server-sent event.
+
+    The event id is the newest publishedAt in the batch, so a reconnecting
+    EventSource sends it back as Last-Event-ID and resumes from there.
+
+    Args:
+        articles: The articles to announce, oldest first.
+
+    Returns:
+        The encoded event, ready to be written to every subscriber.
+    """
+    payload = NewArticlesEvent(
+        articles=[ArticlePreview.from_article(a) for a in articles]
+    )
+    last_seen = max(a.publishedAt for a in articles)
+    return (
+        f"id: {last_seen.isoformat()}\n"
+        f"event: articles\n"
+        f"data: {payload.model_dump_json()}\n\n"
+    ).encode("utf-8")
+
+
+def chunk_backlog(
+    articles: list[Article], size: int = BACKLOG_CHUNK_SIZE
+) -> Iterator[list[Article]]:
+    """
+    Split a backlog into chunks for replay, oldest first.
+
+    Each chunk becomes its own event whose id is the newest publishedAt in
+    it, so a client that disconnects mid-replay resumes after the last chunk
+    it received. Articles sharing a publishedAt are never split across
+    chunks, since resuming is exclusive of the event id; a chunk may exceed
+    `size` to keep them together.
+
+    Args:
+        articles: The backlog, oldest first.
+        size: Target number of articles per chunk.
+
+    Yields:
+        Consecutive chunks of the backlog.
+    """
+    start = 0
+    while start < len(articles):
+        end = min(start + size, len(articles))
+        while end < len(articles) and (
+            articles[end].publishedAt == articles[end - 1].publishedAt
+        ):
+            end += 1
+        yield articles[start:end]
+        start = end
+
+
+class EventStreamStats(BaseModel):
+    """
+    Event stream subscriber counters.
+    """
+
+    subscribers: int = Field(..., description="Currently connected stream clients")
+    evictions: int = Field(
+        ..., description="Clients evicted for falling behind since startup"
+    )
+
+
+class EventSubscriber:
+    """
+    A single stream client with a bounded queue of pending events.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        """
+        Initialize the subscriber.
+
+        Args:
+            queue_size: Maximum number of undelivered events.
+        """
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=queue_size)
+        self.evicted = False
+
+    async def next_event(self, timeout: float) -> Optional[bytes]:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait before giving up.
+
+        Returns:
+            The encoded event, or None if the timeout expired first.
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ArticleBroadcaster:
+    """
+    Broadcasts each event, serialized once, to every subscriber.
+
+    Subscribers whose queue is full are evicted rather than allowed to hold
+    back the others; they reconnect and catch up from their last event id.
+    """
+
+    def __init__(self, queue_size: int = settings.EVENT_QUEUE_SIZE) -> None:
+        """
+        Initialize the broadcaster.
+
+        Args:
+            queue_size: Maximum number of undelivered events per subscriber.
+        """
+        self._queue_size = queue_size
+        self._subscribers: set[EventSubscriber] = set()
+        self._evictions = 0
+
+    def subscribe(self) -> EventSubscriber:
+        """
+        Register a new subscriber.
+        """
+        subscriber = EventSubscriber(self._queue_size)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: EventSubscriber) -> None:
+        """
+        Remove a subscriber.
+        """
+        self._subscribers.discard(subscriber)
+
+    def publish(self, articles: list[Article]) -> int:
+        """
+        Announce newly published articles to all subscribers.
+
+        Args:
+            articles: The new articles, in any order.
+
+        Returns:
+            Number of subscribers the event was delivered to.
+        """
+        if not articles:
+            return 0
+
+        event = format_articles_event(sorted(articles, key=lambda a: a.publishedAt))
+        delivered = 0
+        evicted = 0
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(event)
+                delivered += 1
+            except asyncio.QueueFull:
+                subscriber.evicted = True
+                self._subscribers.discard(subscriber)
+                evicted += 1
+
+        if evicted:
+            self._evictions += evicted
+            logger.warning(f"Evicted {evicted} slow event stream subscribers")
+        return delivered
+
+    def get_stats(self) -> EventStreamStats:
+        """
+        Get subscriber and eviction counts.
+        """
+        return EventStreamStats(
+            subscribers=len(self._subscribers),
+            evictions=self._evictions,
+        )
+
+
+async def watch_snapshot(
+    service: ArticleService,
+    broadcaster: ArticleBroadcaster,
+    interval: float = settings.SNAPSHOT_RELOAD_INTERVAL,
+) -> None:
+    """
+    Periodically reload the article snapshot and publish new articles.
+
+    Runs until cancelled. Reading, validating and indexing the data file
+    happens in a worker thread; the event loop only swaps in the finished
+    snapshot, so request handlers never observe a half-synced index.
+
+    Args:
+        service: The article service to reload.
+        broadcaster: The broadcaster to publish new articles to.
+        interval: Seconds between checks of the data file.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if not service.snapshot_changed():
+                continue
+            prepared = await asyncio.to_thread(service.prepare_snapshot)
+            added = service.apply_snapshot(prepared)
+        except Exception as exc:
+            logger.error(f"Snapshot reload failed: {exc}", exc_info=True)
+            continue
+        if added:
+            delivered = broadcaster.publish(added)
+            logger.info(
+                f"Snapshot reload added {len(added)} articles, "
+                f"notified {delivered} subscribers"
+            )
+
+
+# Singleton instance for dependency injection
+_article_broadcaster_instance: Optional[ArticleBroadcaster] = None
+
+
+def get_article_broadcaster() -> ArticleBroadcaster:
+    """
+    Get or create the singleton ArticleBroadcaster instance.
+
+    Returns:
+        The singleton ArticleBroadcaster instance.
+    """
+    global _article_broadcaster_instance
+    if _article_broadcaster_instance is None:
+        _article_broadcaster_instance = ArticleBroadcaster()
+    return _article_broadcaster_instance
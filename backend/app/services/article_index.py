@@ -0,0 +1,513 @@
+"""
+In-memory indexes over the article snapshot.
+
+The index is built once when articles are loaded. On reload a copy of it is
+brought in sync by applying only the articles that were added, removed, or
+changed, so the index being served is never modified.
+"""
+import bisect
+import heapq
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from app.models import Article, ArticleCategory
+
+# Scopes up to this size count tags by walking their articles, which is
+# cheaper than intersecting many tag posting lists with a small set
+SCOPED_TAG_WALK_LIMIT = 1000
+
+
+def normalize_tag(tag: str) -> str:
+    """
+    Normalize a tag for case-insensitive lookups.
+
+    Args:
+        tag: The tag as it appears on an article or in a query.
+
+    Returns:
+        The casefolded, whitespace-stripped tag.
+    """
+    return tag.strip().casefold()
+
+
+def normalize_datetime(value: datetime) -> datetime:
+    """
+    Make a datetime timezone-aware so it can be compared with publishedAt.
+
+    Naive datetimes are assumed to be in UTC.
+
+    Args:
+        value: The datetime to normalize.
+
+    Returns:
+        A timezone-aware datetime.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _tag_keys(article: Article) -> dict[str, str]:
+    """
+    Map each distinct normalized tag on an article to its display name.
+    """
+    keys: dict[str, str] = {}
+    for tag in article.tags:
+        keys.setdefault(normalize_tag(tag), tag)
+    return keys
+
+
+class ArticleIndex:
+    """
+    Id, category, tag and publication-date indexes over a set of articles.
+
+    Posting lists hold article ids, so counts are simply their sizes and
+    scoped queries are set intersections instead of corpus scans.
+    """
+
+    def __init__(self, articles: Optional[Iterable[Article]] = None) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            articles: Optional articles to index immediately.
+        """
+        self._by_id: dict[str, Article] = {}
+        self._category_postings: dict[ArticleCategory, set[str]] = {
+            category: set() for category in ArticleCategory
+        }
+        self._tag_postings: dict[str, set[str]] = {}
+        self._tag_names: dict[str, str] = {}
+        self._tag_counts: Counter[str] = Counter()
+        # Tags ordered by count, then tag; rebuilt lazily after changes
+        self._ranked_tags: Optional[list[tuple[str, int]]] = None
+        # (publishedAt, id) pairs in ascending order for range bisection
+        self._by_published: list[tuple[datetime, str]] = []
+        # The same order restricted to each category, for paging
+        self._category_by_published: dict[
+            ArticleCategory, list[tuple[datetime, str]]
+        ] = {category: [] for category in ArticleCategory}
+
+        if articles is not None:
+            for article in articles:
+                self._add(article, keep_sorted=False)
+            self._by_published.sort()
+            for entries in self._category_by_published.values():
+                entries.sort()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def copy(self) -> "ArticleIndex":
+        """
+        Make an independent copy that can be synced without affecting this one.
+
+        Articles are shared, since they are never modified once loaded.
+
+        Returns:
+            A new ArticleIndex with the same contents.
+        """
+        clone = ArticleIndex()
+        clone._by_id = dict(self._by_id)
+        clone._category_postings = {
+            category: set(postings)
+            for category, postings in self._category_postings.items()
+        }
+        clone._tag_postings = {
+            key: set(postings) for key, postings in self._tag_postings.items()
+        }
+        clone._tag_names = dict(self._tag_names)
+        clone._tag_counts = Counter(self._tag_counts)
+        clone._ranked_tags = self._ranked_tags
+        clone._by_published = list(self._by_published)
+        clone._category_by_published = {
+            category: list(entries)
+            for category, entries in self._category_by_published.items()
+        }
+        return clone
+
+    def _add(self, article: Article, keep_sorted: bool = True) -> None:
+        """
+        Add an article to every index.
+
+        Args:
+            article: The article to add.
+            keep_sorted: If False, append to the date index without keeping it
+                sorted. Used for bulk builds that sort once at the end.
+        """
+        self._by_id[article.id] = article
+        self._category_postings[article.category].add(article.id)
+        for key, tag in _tag_keys(article).items():
+            self._tag_postings.setdefault(key, set()).add(article.id)
+            self._tag_names.setdefault(key, tag)
+            self._tag_counts[key] += 1
+        self._ranked_tags = None
+        entry = (article.publishedAt, article.id)
+        for entries in (
+            self._by_published,
+            self._category_by_published[article.category],
+        ):
+            if keep_sorted:
+                bisect.insort(entries, entry)
+            else:
+                entries.append(entry)
+
+    def _remove(self, article_id: str) -> Optional[Article]:
+        """
+        Remove an article from every index.
+
+        Returns:
+            The removed article, or None if it was not indexed.
+        """
+        article = self._by_id.pop(article_id, None)
+        if article is None:
+            return None
+
+        self._category_postings[article.category].discard(article_id)
+        for key in _tag_keys(article):
+            postings = self._tag_postings.get(key)
+            if postings is None:
+                continue
+            postings.discard(article_id)
+            self._tag_counts[key] -= 1
+            if not postings:
+                del self._tag_postings[key]
+                del self._tag_names[key]
+                del self._tag_counts[key]
+        self._ranked_tags = None
+
+        entry = (article.publishedAt, article_id)
+        for entries in (
+            self._by_published,
+            self._category_by_published[article.category],
+        ):
+            position = bisect.bisect_left(entries, entry)
+            if position < len(entries) and entries[position] == entry:
+                del entries[position]
+
+        return article
+
+    def sync(self, articles: Iterable[Article]) -> tuple[list[Article], list[Article]]:
+        """
+        Bring the index in line with a freshly loaded snapshot.
+
+        Only articles that were added, removed, or changed are touched, so a
+        reload that changes a handful of articles costs a handful of updates.
+
+        Args:
+            articles: The complete new set of articles.
+
+        Returns:
+            Tuple of (upserted articles, removed articles). Removed articles
+            include the previous versions of articles that changed.
+        """
+        incoming = {article.id: article for article in articles}
+
+        removed: list[Article] = []
+        for article_id in list(self._by_id):
+            if article_id not in incoming:
+                old = self._remove(article_id)
+                if old is not None:
+                    removed.append(old)
+
+        upserted: list[Article] = []
+        for article_id, article in incoming.items():
+            current = self._by_id.get(article_id)
+            if current is not None and current == article:
+                continue
+            if current is not None:
+                self._remove(article_id)
+                removed.append(current)
+            self._add(article)
+            upserted.append(article)
+
+        return upserted, removed
+
+    def get(self, article_id: str) -> Optional[Article]:
+        """
+        Look up an article by id.
+        """
+        return self._by_id.get(article_id)
+
+    def all_ids(self) -> set[str]:
+        """
+        Get the ids of every indexed article.
+        """
+        return set(self._by_id)
+
+    def ids_for_category(self, category: ArticleCategory) -> set[str]:
+        """
+        Get the posting list for a category.
+        """
+        return self._category_postings[category]
+
+    def ids_for_tag(self, tag: str) -> set[str]:
+        """
+        Get the posting list for a tag (case-insensitive).
+        """
+        return self._tag_postings.get(normalize_tag(tag), set())
+
+    def ids_published_between(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[str]:
+        """
+        Get ids of articles published within an inclusive date range.
+
+        Args:
+            since: Optional lower bound on publishedAt.
+            until: Optional upper bound on publishedAt.
+
+        Returns:
+            Matching ids in ascending publishedAt order.
+        """
+        lo = 0
+        hi = len(self._by_published)
+        if since is not None:
+            lo = bisect.bisect_left(
+                self._by_published, (normalize_datetime(since), "")
+            )
+        if until is not None:
+            # Compare on the timestamp alone so every id at `until` is included
+            hi = bisect.bisect_right(
+                self._by_published,
+                normalize_datetime(until),
+                key=lambda entry: entry[0],
+            )
+        return [article_id for _, article_id in self._by_published[lo:hi]]
+
+    def newest_ids(self, ids: set[str], limit: int) -> list[str]:
+        """
+        Get the most recently published ids within a set of ids.
+
+        Dense sets are found by walking the date index from the newest end,
+        which expects to visit about limit * len(self) / len(ids) entries.
+        Sparse sets are ranked directly, which visits each id once.
+
+        Args:
+            ids: The ids to choose from, typically a posting list.
+            limit: Maximum number of ids to return.
+
+        Returns:
+            Up to `limit` ids, newest first.
+        """
+        if limit <= 0 or not ids:
+            return []
+        if limit * len(self._by_published) < len(ids) * len(ids):
+            newest: list[str] = []
+            for _, article_id in reversed(self._by_published):
+                if article_id in ids:
+                    newest.append(article_id)
+                    if len(newest) >= limit:
+                        break
+            return newest
+        entries = [
+            (self._by_id[article_id].publishedAt, article_id)
+            for article_id in ids
+            if article_id in self._by_id
+        ]
+        return [article_id for _, article_id in heapq.nlargest(limit, entries)]
+
+    def page_by_published(
+        self,
+        category: Optional[ArticleCategory] = None,
+        offset: int = 0,
+        limit: int = 20,
+        descending: bool = True,
+    ) -> tuple[list[Article], int]:
+        """
+        Get one page of articles in (publishedAt, id) order.
+
+        The page is sliced straight out of the date index, so its cost does
+        not depend on the corpus size or on how deep the page is.
+
+        Args:
+            category: Optional category to page through instead of everything.
+            offset: Number of articles to skip.
+            limit: Maximum number of articles to return.
+            descending: If True, newest first.
+
+        Returns:
+            Tuple of (articles on the page, total number of articles).
+        """
+        entries = (
+            self._by_published
+            if category is None
+            else self._category_by_published[category]
+        )
+        total = len(entries)
+        page: Iterable[tuple[datetime, str]]
+        if descending:
+            stop = max(total - offset, 0)
+            start = max(stop - limit, 0)
+            page = reversed(entries[start:stop])
+        else:
+            page = entries[offset:offset + limit]
+        return [self._by_id[article_id] for _, article_id in page], total
+
+    def latest(self, limit: int) -> list[Article]:
+        """
+        Get the most recently published articles.
+
+        Args:
+            limit: Maximum number of articles to return.
+
+        Returns:
+            Up to `limit` articles, newest first.
+        """
+        newest = self._by_published[-limit:] if limit > 0 else []
+        return [self._by_id[article_id] for _, article_id in reversed(newest)]
+
+    def query(
+        self,
+        category: Optional[ArticleCategory] = None,
+        tags: Optional[Iterable[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[Article]:
+        """
+        Get articles matching a category, every given tag, and a date range.
+
+        Posting lists are intersected smallest first. The date range is then
+        applied either by checking the remaining candidates or by walking the
+        bisected date slice, whichever is smaller.
+
+        Args:
+            category: Optional category filter.
+            tags: Optional tags that must all be present (case-insensitive).
+            since: Optional lower bound on publishedAt (inclusive).
+            until: Optional upper bound on publishedAt (inclusive).
+
+        Returns:
+            Matching articles in ascending publishedAt order.
+        """
+        postings: list[set[str]] = []
+        if category is not None:
+            postings.append(self.ids_for_category(category))
+        for tag in tags or []:
+            postings.append(self.ids_for_tag(tag))
+
+        if not postings:
+            ids = self.ids_published_between(since=since, until=until)
+            return [self._by_id[article_id] for article_id in ids]
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+
+        if since is None and until is None:
+            articles = [self._by_id[article_id] for article_id in candidates]
+            return sorted(articles, key=lambda a: (a.publishedAt, a.id))
+
+        date_ids = self.ids_published_between(since=since, until=until)
+        if len(candidates) < len(date_ids):
+            lower = normalize_datetime(since) if since is not None else None
+            upper = normalize_datetime(until) if until is not None else None
+            articles = [
+                self._by_id[article_id]
+                for article_id in candidates
+                if (lower is None or self._by_id[article_id].publishedAt >= lower)
+                and (upper is None or self._by_id[article_id].publishedAt <= upper)
+            ]
+            return sorted(articles, key=lambda a: (a.publishedAt, a.id))
+
+        return [
+            self._by_id[article_id]
+            for article_id in date_ids
+            if article_id in candidates
+        ]
+
+    def category_counts(
+        self, scope: Optional[set[str]] = None
+    ) -> dict[ArticleCategory, int]:
+        """
+        Count articles per category, optionally within a set of ids.
+
+        Args:
+            scope: Optional set of article ids to restrict counts to.
+
+        Returns:
+            Mapping of category to article count.
+        """
+        if scope is None:
+            return {
+                category: len(postings)
+                for category, postings in self._category_postings.items()
+            }
+        return {
+            category: len(postings & scope)
+            for category, postings in self._category_postings.items()
+        }
+
+    def top_tags(
+        self, limit: int, scope: Optional[set[str]] = None
+    ) -> list[tuple[str, int]]:
+        """
+        Get the most frequent tags, optionally within a set of ids.
+
+        Args:
+            limit: Maximum number of tags to return.
+            scope: Optional set of article ids to restrict counts to.
+
+        Returns:
+            List of (tag display name, count) pairs, most frequent first.
+        """
+        if scope is None:
+            ranked = self._get_ranked_tags()[:limit]
+        elif len(scope) <= SCOPED_TAG_WALK_LIMIT:
+            counts: Counter[str] = Counter()
+            for article_id in scope:
+                article = self._by_id.get(article_id)
+                if article is not None:
+                    counts.update(_tag_keys(article).keys())
+            # Break ties by tag so results are stable across processes
+            ranked = heapq.nsmallest(
+                limit, counts.items(), key=lambda item: (-item[1], item[0])
+            )
+        else:
+            ranked = self._top_tags_by_intersection(limit, scope)
+
+        return [(self._tag_names[key], count) for key, count in ranked]
+
+    def _get_ranked_tags(self) -> list[tuple[str, int]]:
+        """
+        Get every tag key with its count, most frequent first.
+        """
+        if self._ranked_tags is None:
+            self._ranked_tags = sorted(
+                self._tag_counts.items(), key=lambda item: (-item[1], item[0])
+            )
+        return self._ranked_tags
+
+    def _top_tags_by_intersection(
+        self, limit: int, scope: set[str]
+    ) -> list[tuple[str, int]]:
+        """
+        Find the most frequent tags within a scope by intersecting postings.
+
+        Tags are visited in order of their overall count. A tag's count in
+        the scope can never exceed its overall count, so the walk stops as
+        soon as no remaining tag can displace the current top `limit`.
+
+        Args:
+            limit: Maximum number of tags to return.
+            scope: Set of article ids to restrict counts to.
+
+        Returns:
+            List of (tag key, scoped count) pairs, most frequent first.
+        """
+        best: list[tuple[int, str]] = []
+        for key, total in self._get_ranked_tags():
+            if len(best) >= limit and total < -best[-1][0]:
+                break
+            count = len(self._tag_postings[key] & scope)
+            if count == 0:
+                continue
+            bisect.insort(best, (-count, key))
+            del best[limit:]
+        return [(key, -negated) for negated, key in best]
@@ -1,12 +1,68 @@
 """
 Article service layer for business logic and data access.
 """
+import hashlib
 import json
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TypedDict
+
+from app.models import (
+    Article,
+    ArticleCategory,
+    ArticlesResponse,
+    FacetCount,
+    FacetsResponse,
+    Suggestion,
+    SuggestResponse,
+)
+from app.services.article_index import ArticleIndex, normalize_datetime
+from app.services.related_index import RelatedIndex
+from app.services.suggest_index import SuggestIndex
+
+
+class CacheInfo(TypedDict):
+    """
+    State of the in-memory article cache.
+    """
+
+    cached_at: Optional[datetime]
+    article_count: int
+    snapshot_version: Optional[str]
+
+
+@dataclass(frozen=True)
+class ArticleSnapshot:
+    """
+    One version of the article data together with every index built over it.
+
+    The service swaps whole snapshots, so a request that reads the snapshot
+    once sees a consistent set of articles and indexes even while a reload
+    runs in another thread.
+    """
+
+    articles: list[Article]
+    version: str
+    data_mtime_ns: int
+    loaded_at: datetime
+    index: ArticleIndex
+    suggest_index: SuggestIndex
+    related_index: RelatedIndex
 
-from app.models import Article, ArticleCategory, ArticlesResponse
+
+@dataclass
+class PreparedSnapshot:
+    """
+    A fully indexed snapshot read from disk, not yet made current.
+    """
+
+    snapshot: ArticleSnapshot
+    # Articles that were not present in the snapshot this was prepared from
+    added: list[Article]
+    timings: dict[str, float] = field(default_factory=dict)
 
 
 class ArticleService:
@@ -30,9 +86,41 @@ class ArticleService:
         else:
             self._data_path = data_path
 
-        # In-memory cache
-        self._articles_cache: Optional[list[Article]] = None
-        self._cache_timestamp: Optional[datetime] = None
+        # Current articles and indexes, replaced as a whole on reload
+        self._snapshot: Optional[ArticleSnapshot] = None
+        # Serializes loads triggered by requests running in worker threads
+        self._load_lock = threading.Lock()
+
+        # Duration of each phase of the most recent load, in milliseconds
+        self._load_timings: dict[str, float] = {}
+
+    def _load_snapshot(self, force_reload: bool = False) -> ArticleSnapshot:
+        """
+        Get the current snapshot, loading it from file first if necessary.
+
+        Args:
+            force_reload: If True, bypass cache and reload from file.
+
+        Returns:
+            The current ArticleSnapshot.
+
+        Raises:
+            FileNotFoundError: If articles.json doesn't exist.
+            ValueError: If JSON is malformed or validation fails.
+        """
+        # Return cached data if available and not forcing reload
+        snapshot = self._snapshot
+        if not force_reload and snapshot is not None:
+            return snapshot
+
+        with self._load_lock:
+            # Another thread may have finished loading while this one waited
+            snapshot = self._snapshot
+            if not force_reload and snapshot is not None:
+                return snapshot
+            self.apply_snapshot(self.prepare_snapshot())
+            assert self._snapshot is not None
+            return self._snapshot
 
     def _load_articles(self, force_reload: bool = False) -> list[Article]:
         """
@@ -48,25 +136,154 @@ class ArticleService:
             FileNotFoundError: If articles.json doesn't exist.
             ValueError: If JSON is malformed or validation fails.
         """
-        # Return cached data if available and not forcing reload
-        if not force_reload and self._articles_cache is not None:
-            return self._articles_cache
+        return self._load_snapshot(force_reload).articles
+
+    def snapshot_changed(self) -> bool:
+        """
+        Check whether the data file changed since the last load.
+
+        Returns:
+            True if nothing is loaded yet or the file's mtime differs.
+        """
+        snapshot = self._snapshot
+        return (
+            snapshot is None
+            or not self._data_path.exists()
+            or self._data_path.stat().st_mtime_ns != snapshot.data_mtime_ns
+        )
+
+    def prepare_snapshot(self) -> PreparedSnapshot:
+        """
+        Read, validate and index the data file without touching the current
+        snapshot.
+
+        The article index is synced on a copy of the current one, so only
+        the differences are applied and requests keep reading the original.
+        Nothing here modifies service state, so it can run in a worker
+        thread while requests are being served.
 
-        # Load from file
+        Returns:
+            PreparedSnapshot to hand to apply_snapshot.
+
+        Raises:
+            FileNotFoundError: If articles.json doesn't exist.
+            ValueError: If JSON is malformed or validation fails.
+        """
         if not self._data_path.exists():
             raise FileNotFoundError(f"Articles data file not found: {self._data_path}")
 
-        with open(self._data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        started = time.perf_counter()
+        data_mtime_ns = self._data_path.stat().st_mtime_ns
+        raw = self._data_path.read_bytes()
+        data = json.loads(raw)
+        read_done = time.perf_counter()
 
         # Parse and validate articles using Pydantic models
         articles = [Article(**article_data) for article_data in data["articles"]]
+        validate_done = time.perf_counter()
+
+        version = hashlib.sha256(raw).hexdigest()[:16]
+        current = self._snapshot
+        added: list[Article] = []
+        if current is not None and current.version == version:
+            # Same content under a new mtime; keep the existing indexes
+            snapshot = replace(
+                current,
+                articles=articles,
+                data_mtime_ns=data_mtime_ns,
+                loaded_at=datetime.now(),
+            )
+        else:
+            # Build indexes on first load, then apply only the differences
+            if current is None:
+                index = ArticleIndex(articles)
+            else:
+                index = current.index.copy()
+                upserted, removed = index.sync(articles)
+                removed_ids = {a.id for a in removed}
+                added = [a for a in upserted if a.id not in removed_ids]
+            snapshot = ArticleSnapshot(
+                articles=articles,
+                version=version,
+                data_mtime_ns=data_mtime_ns,
+                loaded_at=datetime.now(),
+                index=index,
+                suggest_index=SuggestIndex(articles),
+                # Neighbours are computed lazily, so start over with weights
+                # from the new snapshot instead of patching stale ones
+                related_index=RelatedIndex(index),
+            )
+        index_done = time.perf_counter()
+
+        return PreparedSnapshot(
+            snapshot=snapshot,
+            added=added,
+            timings={
+                "read": (read_done - started) * 1000,
+                "validate": (validate_done - read_done) * 1000,
+                "index": (index_done - validate_done) * 1000,
+            },
+        )
+
+    def apply_snapshot(self, prepared: PreparedSnapshot) -> list[Article]:
+        """
+        Make a prepared snapshot the current one.
 
-        # Update cache
-        self._articles_cache = articles
-        self._cache_timestamp = datetime.now()
+        This only swaps a reference, so it is safe to call from the event
+        loop while request handlers read the previous snapshot.
+
+        Args:
+            prepared: The result of prepare_snapshot.
+
+        Returns:
+            Articles that were not present before, or an empty list if this
+            is the first load.
+        """
+        self._snapshot = prepared.snapshot
+        self._load_timings = dict(prepared.timings)
+        return prepared.added
+
+    def get_articles_published_after(
+        self, published_after: datetime
+    ) -> list[Article]:
+        """
+        Get every article published strictly after a timestamp.
+
+        Args:
+            published_after: Exclusive lower bound on publishedAt.
+
+        Returns:
+            Matching articles, oldest first.
+        """
+        published_after = normalize_datetime(published_after)
+        articles = self._get_index().query(since=published_after)
+        return [a for a in articles if a.publishedAt > published_after]
+
+    def _get_index(self) -> ArticleIndex:
+        """
+        Get the article index, loading articles first if necessary.
+
+        Returns:
+            The ArticleIndex for the current snapshot.
+        """
+        return self._load_snapshot().index
+
+    @staticmethod
+    def _matches_search(article: Article, search_lower: str) -> bool:
+        """
+        Check whether an article's title or summary contains a search query.
+
+        Args:
+            article: The article to check.
+            search_lower: Lowercased search query.
 
-        return articles
+        Returns:
+            True if the query appears in the title or summary.
+        """
+        return (
+            search_lower in article.title.lower()
+            or search_lower in article.summary.lower()
+        )
 
     def get_articles(
         self,
@@ -76,6 +293,9 @@ class ArticleService:
         search: Optional[str] = None,
         sort_by: str = "publishedAt",
         sort_order: str = "desc",
+        tags: Optional[list[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
     ) -> ArticlesResponse:
         """
         Get paginated and filtered articles.
@@ -87,34 +307,65 @@ class ArticleService:
             search: Optional search query (searches in title and summary).
             sort_by: Field to sort by (default: publishedAt).
             sort_order: Sort order, "asc" or "desc" (default: desc).
+            tags: Optional tags that must all be present (case-insensitive).
+            since: Optional lower bound on publishedAt (inclusive).
+            until: Optional upper bound on publishedAt (inclusive).
 
         Returns:
             ArticlesResponse with paginated articles and metadata.
         """
-        # Load all articles
-        articles = self._load_articles()
+        if (
+            sort_by == "publishedAt"
+            and not search
+            and not tags
+            and since is None
+            and until is None
+        ):
+            # Page straight out of the date index instead of sorting the corpus
+            articles, total = self._get_index().page_by_published(
+                category=category,
+                offset=(page - 1) * limit,
+                limit=limit,
+                descending=sort_order.lower() == "desc",
+            )
+            return ArticlesResponse(
+                articles=articles, total=total, page=page, limit=limit
+            )
+
+        if tags or since is not None or until is not None:
+            # Served from the tag postings and publishedAt order; the result
+            # is already date-sorted, so the sort below runs in linear time
+            articles = self._get_index().query(
+                category=category, tags=tags, since=since, until=until
+            )
+        else:
+            # Load all articles
+            articles = self._load_articles()
 
-        # Filter by category
-        if category:
-            articles = [a for a in articles if a.category == category]
+            # Filter by category
+            if category:
+                articles = [a for a in articles if a.category == category]
 
         # Filter by search query (case-insensitive search in title and summary)
         if search:
             search_lower = search.lower()
-            articles = [
-                a
-                for a in articles
-                if search_lower in a.title.lower() or search_lower in a.summary.lower()
-            ]
+            articles = [a for a in articles if self._matches_search(a, search_lower)]
 
-        # Sort articles
+        # Sort articles, breaking ties by id so the order does not depend on
+        # whether the index path or the scan path produced the list
         reverse = sort_order.lower() == "desc"
         if sort_by == "publishedAt":
-            articles = sorted(articles, key=lambda x: x.publishedAt, reverse=reverse)
+            articles = sorted(
+                articles, key=lambda x: (x.publishedAt, x.id), reverse=reverse
+            )
         elif sort_by == "title":
-            articles = sorted(articles, key=lambda x: x.title.lower(), reverse=reverse)
+            articles = sorted(
+                articles, key=lambda x: (x.title.lower(), x.id), reverse=reverse
+            )
         elif sort_by == "category":
-            articles = sorted(articles, key=lambda x: x.category.value, reverse=reverse)
+            articles = sorted(
+                articles, key=lambda x: (x.category.value, x.id), reverse=reverse
+            )
 
         # Calculate pagination
         total = len(articles)
@@ -129,6 +380,86 @@ class ArticleService:
             limit=limit,
         )
 
+    def get_facets(
+        self,
+        search: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        top_tags: int = 20,
+    ) -> FacetsResponse:
+        """
+        Get article counts per category and the most frequent tags.
+
+        Unscoped counts come straight from the precomputed posting lists.
+        Scoped counts narrow the corpus with the date index first and only
+        then apply the search query to what remains.
+
+        Args:
+            search: Optional search query (matches title and summary).
+            since: Optional lower bound on publishedAt (inclusive).
+            until: Optional upper bound on publishedAt (inclusive).
+            top_tags: Maximum number of tags to return.
+
+        Returns:
+            FacetsResponse with category and tag counts.
+        """
+        index = self._get_index()
+
+        scope: Optional[set[str]] = None
+        if since is not None or until is not None:
+            scope = set(index.ids_published_between(since=since, until=until))
+        if search:
+            search_lower = search.lower()
+            candidates = scope if scope is not None else index.all_ids()
+            articles = (index.get(article_id) for article_id in candidates)
+            scope = {
+                article.id
+                for article in articles
+                if article is not None and self._matches_search(article, search_lower)
+            }
+
+        categories = [
+            FacetCount(value=category.value, count=count)
+            for category, count in index.category_counts(scope).items()
+        ]
+        tags = [
+            FacetCount(value=tag, count=count)
+            for tag, count in index.top_tags(top_tags, scope)
+        ]
+
+        return FacetsResponse(
+            total=len(index) if scope is None else len(scope),
+            categories=categories,
+            tags=tags,
+        )
+
+    def get_suggestions(self, query: str, limit: int = 10) -> SuggestResponse:
+        """
+        Get autocomplete suggestions for a search-box prefix.
+
+        Args:
+            query: The text typed so far.
+            limit: Maximum number of suggestions to return.
+
+        Returns:
+            SuggestResponse with completions from title words and tags.
+        """
+        suggest_index = self._load_snapshot().suggest_index
+        suggestions = [
+            Suggestion(text=term.text, type=term.kind, count=term.count)
+            for term in suggest_index.suggest(query, limit=limit)
+        ]
+        return SuggestResponse(query=query, suggestions=suggestions)
+
+    def get_all_articles(self) -> list[Article]:
+        """
+        Get every article in the current snapshot.
+
+        Returns:
+            List of all articles, in data file order.
+        """
+        return list(self._load_articles())
+
     def get_article_by_id(self, article_id: str) -> Optional[Article]:
         """
         Get a single article by its ID.
@@ -139,8 +470,55 @@ class ArticleService:
         Returns:
             Article object if found, None otherwise.
         """
-        articles = self._load_articles()
-        return next((a for a in articles if a.id == article_id), None)
+        return self._get_index().get(article_id)
+
+    def get_articles_by_ids(
+        self, article_ids: list[str]
+    ) -> tuple[list[Article], list[str]]:
+        """
+        Get several articles by their IDs in one lookup.
+
+        Args:
+            article_ids: The article identifiers, in the order to return them.
+                Duplicates are returned once.
+
+        Returns:
+            Tuple of (found articles in request order, IDs that were not found).
+        """
+        index = self._get_index()
+        found: list[Article] = []
+        missing: list[str] = []
+        for article_id in dict.fromkeys(article_ids):
+            article = index.get(article_id)
+            if article is None:
+                missing.append(article_id)
+            else:
+                found.append(article)
+        return found, missing
+
+    def get_related_articles(
+        self, article_id: str, limit: int = 5
+    ) -> Optional[list[Article]]:
+        """
+        Get articles related to an article by shared tags and category.
+
+        Neighbours are computed on first request per snapshot and memoized,
+        so loading the snapshot does not pay for articles nobody views. That
+        first computation scores up to a few hundred candidates, which is
+        why the route runs in the thread pool rather than on the event loop.
+
+        Args:
+            article_id: The unique article identifier.
+            limit: Maximum number of related articles to return.
+
+        Returns:
+            Related articles, most similar first, or None if the article
+            does not exist.
+        """
+        snapshot = self._load_snapshot()
+        if snapshot.index.get(article_id) is None:
+            return None
+        return snapshot.related_index.get(article_id, limit=limit)
 
     def get_categories(self) -> list[str]:
         """
@@ -210,29 +588,48 @@ class ArticleService:
         Returns:
             List of recent articles, sorted by publishedAt (newest first).
         """
-        articles = self._load_articles()
-        sorted_articles = sorted(articles, key=lambda x: x.publishedAt, reverse=True)
-        return sorted_articles[:limit]
+        return self._get_index().latest(limit)
 
     def clear_cache(self) -> None:
         """
         Clear the in-memory article cache.
         Useful for forcing a reload of data from file.
         """
-        self._articles_cache = None
-        self._cache_timestamp = None
+        self._snapshot = None
+
+    def get_snapshot_version(self) -> str:
+        """
+        Get the content hash of the current snapshot, loading it if necessary.
 
-    def get_cache_info(self) -> dict[str, Optional[datetime | int]]:
+        Returns:
+            The snapshot version.
+        """
+        return self._load_snapshot().version
+
+    def get_cache_info(self) -> CacheInfo:
         """
         Get information about the current cache state.
 
         Returns:
-            Dictionary with cache timestamp and article count.
+            CacheInfo with cache timestamp, article count and snapshot version.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return CacheInfo(cached_at=None, article_count=0, snapshot_version=None)
+        return CacheInfo(
+            cached_at=snapshot.loaded_at,
+            article_count=len(snapshot.articles),
+            snapshot_version=snapshot.version,
+        )
+
+    def get_load_timings(self) -> dict[str, float]:
+        """
+        Get how long each phase of the most recent load took.
+
+        Returns:
+            Mapping of phase (read, validate, index) to milliseconds.
         """
-        return {
-            "cached_at": self._cache_timestamp,
-            "article_count": len(self._articles_cache) if self._articles_cache else 0,
-        }
+        return dict(self._load_timings)
 
 
 # Singleton instance for dependency injection
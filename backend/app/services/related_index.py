@@ -0,0 +1,156 @@
+"""
+Related-article neighbours, computed on demand per snapshot.
+
+Similarity is a weighted Jaccard over each article's tags and category, with
+features weighted by inverse document frequency. Candidates are drawn from
+the posting lists of the article's own tags, falling back to its category,
+so only articles that share a feature are ever scored instead of every pair
+in the corpus.
+
+Neighbours are computed the first time an article is requested and memoized.
+A new RelatedIndex is created for every snapshot, so the weights an article
+was scored with always match the snapshot it is served from.
+"""
+import heapq
+import math
+from typing import Iterable, Optional
+
+from app.models import Article, ArticleCategory
+from app.services.article_index import ArticleIndex, normalize_tag
+
+# Number of neighbours stored per article
+RELATED_TOP_K = 10
+
+# Candidates drawn from a single posting list; larger postings contribute
+# only their newest articles, which bounds the work per article
+MAX_CANDIDATE_POSTING = 150
+
+
+class RelatedIndex:
+    """
+    Top-K related articles for the articles of one ArticleIndex snapshot.
+    """
+
+    def __init__(self, index: ArticleIndex, top_k: int = RELATED_TOP_K) -> None:
+        """
+        Initialize the index. No neighbours are computed until requested.
+
+        Args:
+            index: The article index to draw postings and articles from. It
+                must not be modified while this RelatedIndex is in use.
+            top_k: Number of neighbours to keep per article.
+        """
+        self._index = index
+        self._top_k = top_k
+        self._weights: dict[str, float] = {}
+        self._totals: dict[str, float] = {}
+        # Bounded candidate lists of large postings, shared across articles
+        self._newest: dict[str, list[str]] = {}
+        self._neighbours: dict[str, list[str]] = {}
+
+    def _weight(self, feature: str, document_frequency: int) -> float:
+        """
+        Get the inverse document frequency weight of a feature.
+        """
+        weight = self._weights.get(feature)
+        if weight is None:
+            ratio = (len(self._index) + 1) / (document_frequency + 1)
+            weight = math.log(ratio) + 1
+            self._weights[feature] = weight
+        return weight
+
+    def _tag_weight(self, key: str) -> float:
+        return self._weight(f"tag:{key}", len(self._index.ids_for_tag(key)))
+
+    def _category_weight(self, category: ArticleCategory) -> float:
+        return self._weight(
+            f"category:{category.value}",
+            len(self._index.ids_for_category(category)),
+        )
+
+    def _total_weight(self, article: Article) -> float:
+        """
+        Get the summed weight of every feature of an article.
+        """
+        total = self._totals.get(article.id)
+        if total is None:
+            keys = {normalize_tag(tag) for tag in article.tags}
+            total = sum(self._tag_weight(key) for key in keys)
+            total += self._category_weight(article.category)
+            self._totals[article.id] = total
+        return total
+
+    def _candidates_from(self, feature: str, postings: set[str]) -> Iterable[str]:
+        """
+        Get the candidates a posting list contributes, newest first if capped.
+        """
+        if len(postings) <= MAX_CANDIDATE_POSTING:
+            return postings
+        newest = self._newest.get(feature)
+        if newest is None:
+            newest = self._index.newest_ids(postings, MAX_CANDIDATE_POSTING)
+            self._newest[feature] = newest
+        return newest
+
+    def _compute(self, article: Article) -> list[str]:
+        """
+        Score the candidates of an article and keep the top K.
+        """
+        tags: list[tuple[set[str], float]] = []
+        candidates: set[str] = set()
+        for key in {normalize_tag(tag) for tag in article.tags}:
+            postings = self._index.ids_for_tag(key)
+            tags.append((postings, self._tag_weight(key)))
+            candidates.update(self._candidates_from(f"tag:{key}", postings))
+        candidates.discard(article.id)
+
+        # Articles whose tags find too few candidates still have a category
+        if len(candidates) < self._top_k:
+            postings = self._index.ids_for_category(article.category)
+            candidates.update(
+                self._candidates_from(f"category:{article.category.value}", postings)
+            )
+            candidates.discard(article.id)
+
+        total = self._total_weight(article)
+        category_weight = self._category_weight(article.category)
+        scored: list[tuple[float, float, str]] = []
+        for candidate_id in candidates:
+            candidate = self._index.get(candidate_id)
+            if candidate is None:
+                continue
+            shared = sum(
+                weight for postings, weight in tags if candidate_id in postings
+            )
+            if candidate.category == article.category:
+                shared += category_weight
+            union = total + self._total_weight(candidate) - shared
+            scored.append(
+                (-shared / union, -candidate.publishedAt.timestamp(), candidate_id)
+            )
+
+        top = heapq.nsmallest(self._top_k, scored)
+        return [candidate_id for _, _, candidate_id in top]
+
+    def get(self, article_id: str, limit: Optional[int] = None) -> list[Article]:
+        """
+        Get the related articles for an article, computing them on first use.
+
+        Args:
+            article_id: The article to find neighbours for.
+            limit: Optional maximum number of articles to return.
+
+        Returns:
+            Related articles, most similar first.
+        """
+        neighbours = self._neighbours.get(article_id)
+        if neighbours is None:
+            article = self._index.get(article_id)
+            if article is None:
+                return []
+            neighbours = self._compute(article)
+            self._neighbours[article_id] = neighbours
+
+        articles = [self._index.get(neighbour_id) for neighbour_id in neighbours]
+        related = [article for article in articles if article is not None]
+        return related[:limit] if limit is not None else related
@@ -0,0 +1,190 @@
+"""
+Pre-rendered bodies of the hottest API responses, keyed by snapshot version.
+
+The latest articles, the category list and the first page of the news list
+(overall and per category) are requested far more often than anything else
+and are identical for every client until the snapshot changes. They are
+rendered once per snapshot and served as raw bytes. The same rendering is
+used by the static exporter, so exported files match the API.
+"""
+import threading
+from typing import Optional
+from urllib.parse import quote
+
+from pydantic import TypeAdapter
+
+from app.models import ArticleCategory, ArticleDetail
+from app.services.article_service import ArticleService
+
+# Matches the default limit of /api/news/latest
+LATEST_LIMIT = 10
+
+CATEGORIES_URL = "/api/categories"
+LATEST_URL = "/api/news/latest"
+
+_detail_list_adapter = TypeAdapter(list[ArticleDetail])
+_string_list_adapter = TypeAdapter(list[str])
+
+
+def first_page_url(category: Optional[ArticleCategory] = None) -> str:
+    """
+    Get the URL of the default first page of the news list.
+
+    Args:
+        category: Optional category the page is filtered by.
+
+    Returns:
+        The URL, including the category query parameter if given.
+    """
+    if category is None:
+        return "/api/news"
+    return f"/api/news?category={quote(category.value)}"
+
+
+def hot_urls() -> list[str]:
+    """
+    Get the URL of every response kept in the cache.
+    """
+    return [
+        CATEGORIES_URL,
+        LATEST_URL,
+        first_page_url(),
+        *(first_page_url(category) for category in ArticleCategory),
+    ]
+
+
+def render_hot_response(service: ArticleService, url: str) -> Optional[bytes]:
+    """
+    Render one hot response exactly as its route would.
+
+    Args:
+        service: The article service to render with.
+        url: One of the URLs returned by hot_urls().
+
+    Returns:
+        The JSON body, or None if the URL is not a hot response.
+    """
+    if url == CATEGORIES_URL:
+        return _string_list_adapter.dump_json(service.get_categories())
+    if url == LATEST_URL:
+        articles = service.get_recent_articles(limit=LATEST_LIMIT)
+        return _detail_list_adapter.dump_json(
+            [ArticleDetail.from_article(a) for a in articles]
+        )
+    for category in (None, *ArticleCategory):
+        if url == first_page_url(category):
+            page = service.get_articles(category=category)
+            return page.model_dump_json().encode("utf-8")
+    return None
+
+
+def render_hot_responses(service: ArticleService) -> dict[str, bytes]:
+    """
+    Render every hot response.
+
+    Args:
+        service: The article service to render with.
+
+    Returns:
+        Mapping of URL to JSON body.
+    """
+    bodies: dict[str, bytes] = {}
+    for url in hot_urls():
+        body = render_hot_response(service, url)
+        assert body is not None
+        bodies[url] = body
+    return bodies
+
+
+class ResponseCache:
+    """
+    Hot response bodies for the current snapshot.
+
+    Bodies are dropped as soon as the service reports a new snapshot version
+    and re-rendered on first request, so a stale body is never served.
+    """
+
+    def __init__(self) -> None:
+        self._version: Optional[str] = None
+        self._bodies: dict[str, bytes] = {}
+        # Routes run both on the event loop and in worker threads
+        self._lock = threading.Lock()
+
+    def _current_bodies(self, version: str) -> dict[str, bytes]:
+        """
+        Get the bodies cached for a snapshot version, resetting on change.
+        """
+        with self._lock:
+            if self._version != version:
+                self._version = version
+                self._bodies = {}
+            return self._bodies
+
+    def _store(self, version: str, bodies: dict[str, bytes]) -> None:
+        """
+        Cache bodies if they were rendered from the current snapshot version.
+        """
+        with self._lock:
+            if self._version == version:
+                self._bodies.update(bodies)
+
+    def get(self, service: ArticleService, url: str) -> bytes:
+        """
+        Get a hot response body, rendering it if it is not cached yet.
+
+        Args:
+            service: The article service to render with on a miss.
+            url: One of the URLs returned by hot_urls().
+
+        Returns:
+            The JSON body for the current snapshot.
+
+        Raises:
+            KeyError: If the URL is not a hot response.
+        """
+        version = service.get_snapshot_version()
+        body = self._current_bodies(version).get(url)
+        if body is not None:
+            return body
+
+        body = render_hot_response(service, url)
+        if body is None:
+            raise KeyError(url)
+        # A reload may have landed while rendering; only cache what matches
+        if service.get_snapshot_version() == version:
+            self._store(version, {url: body})
+        return body
+
+    def fill(self, service: ArticleService) -> int:
+        """
+        Render and cache every hot response for the current snapshot.
+
+        Args:
+            service: The article service to render with.
+
+        Returns:
+            Number of cached responses.
+        """
+        version = service.get_snapshot_version()
+        self._current_bodies(version)
+        bodies = render_hot_responses(service)
+        if service.get_snapshot_version() == version:
+            self._store(version, bodies)
+        return len(bodies)
+
+
+# Singleton instance shared by the routes and the warm-up
+_response_cache_instance: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get or create the singleton ResponseCache instance.
+
+    Returns:
+        The singleton ResponseCache instance.
+    """
+    global _response_cache_instance
+    if _response_cache_instance is None:
+        _response_cache_instance = ResponseCache()
+    return _response_cache_instance
@@ -0,0 +1,222 @@
+"""
+Static export of deterministic API responses for CDN or static serving.
+
+List responses come from the same renderer as the API's hot response cache
+and article details go through the route response model, so exported files
+match what the API returns. Each file is written alongside
+a gzip-precompressed copy, and a manifest maps every URL to its file and ETag.
+"""
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from pydantic import BaseModel, Field
+
+from app.models import Article, ArticleCategory, ArticleDetail
+from app.services.article_service import ArticleService
+from app.services.response_cache import (
+    CATEGORIES_URL,
+    LATEST_URL,
+    first_page_url,
+    render_hot_responses,
+)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+class StaticExportResult(BaseModel):
+    """
+    Summary of a static export run.
+    """
+
+    written: int = Field(0, description="Files written because they changed")
+    unchanged: int = Field(0, description="Files skipped as already current")
+    removed: int = Field(0, description="Files deleted for removed articles")
+
+
+def _article_fingerprint(article: Article) -> str:
+    """
+    Hash an article's content to detect changes between exports.
+    """
+    return hashlib.sha256(article.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def _etag(body: bytes) -> str:
+    """
+    Compute a strong ETag for a response body.
+    """
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file so readers never observe a partially written version.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+class StaticExporter:
+    """
+    Writes hot API responses into a directory tree with a manifest of ETags.
+    """
+
+    def __init__(self, service: ArticleService, output_dir: Path) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            service: The article service to render responses with.
+            output_dir: Directory to write the exported tree into.
+        """
+        self._service = service
+        self._output_dir = output_dir
+        self._manifest_path = output_dir / MANIFEST_NAME
+
+    def _read_manifest(self) -> dict[str, Any]:
+        """
+        Read the manifest of the previous export, if there is a usable one.
+        """
+        if not self._manifest_path.exists():
+            return {}
+        with open(self._manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest
+
+    def _write_response(
+        self,
+        url: str,
+        relative_path: str,
+        body: bytes,
+        previous: dict[str, dict[str, Any]],
+        files: dict[str, dict[str, Any]],
+        result: StaticExportResult,
+    ) -> None:
+        """
+        Write a response body and its gzip copy unless they are already current.
+        """
+        etag = _etag(body)
+        path = self._output_dir / relative_path
+        entry = previous.get(url)
+        if entry is not None and entry["etag"] == etag and path.exists():
+            files[url] = entry
+            result.unchanged += 1
+            return
+
+        compressed = gzip.compress(body, mtime=0)
+        _write_atomic(path, body)
+        _write_atomic(path.with_name(path.name + ".gz"), compressed)
+        files[url] = {
+            "path": relative_path,
+            "etag": etag,
+            "size": len(body),
+            "gzipSize": len(compressed),
+        }
+        result.written += 1
+
+    def _remove_response(self, entry: dict[str, Any]) -> None:
+        """
+        Delete a previously exported response and its gzip copy.
+        """
+        path = self._output_dir / entry["path"]
+        for stale in (path, path.with_name(path.name + ".gz")):
+            stale.unlink(missing_ok=True)
+
+    def export(self, full: bool = False) -> StaticExportResult:
+        """
+        Export categories, latest, first pages, and every article detail.
+
+        Article details are only re-rendered for articles whose content changed
+        since the previous export. List responses are always rendered, since
+        they are few, but only rewritten when their ETag changes.
+
+        Args:
+            full: If True, rewrite every file even if it is unchanged. The
+                previous manifest is still used to remove stale files.
+
+        Returns:
+            StaticExportResult with counts of written, unchanged and removed files.
+        """
+        previous_manifest = self._read_manifest()
+        stale_files: dict[str, dict[str, Any]] = previous_manifest.get("files", {})
+
+        # A full export only forgets the previous state for change detection
+        previous_files = {} if full else stale_files
+        previous_articles: dict[str, str] = (
+            {} if full else previous_manifest.get("articles", {})
+        )
+
+        result = StaticExportResult()
+        files: dict[str, dict[str, Any]] = {}
+        fingerprints: dict[str, str] = {}
+
+        # Categories, latest articles and first pages, overall and per category
+        relative_paths = {
+            CATEGORIES_URL: "api/categories.json",
+            LATEST_URL: "api/news/latest.json",
+            first_page_url(): "api/news.json",
+        }
+        for category in ArticleCategory:
+            category_slug = category.value.lower().replace(" ", "-")
+            relative_paths[first_page_url(category)] = (
+                f"api/news/first-page/{category_slug}.json"
+            )
+        for url, body in render_hot_responses(self._service).items():
+            self._write_response(
+                url, relative_paths[url], body, previous_files, files, result
+            )
+
+        # Article details, re-rendered only when the article changed
+        for article in self._service.get_all_articles():
+            article_slug = quote(article.id, safe="")
+            url = f"/api/news/{article_slug}"
+            fingerprint = _article_fingerprint(article)
+            fingerprints[article.id] = fingerprint
+
+            entry = previous_files.get(url)
+            if (
+                entry is not None
+                and previous_articles.get(article.id) == fingerprint
+                and (self._output_dir / entry["path"]).exists()
+            ):
+                files[url] = entry
+                result.unchanged += 1
+                continue
+
+            self._write_response(
+                url,
+                f"api/news/{article_slug}.json",
+                ArticleDetail.from_article(article).model_dump_json().encode(),
+                {},
+                files,
+                result,
+            )
+
+        # Remove responses that are no longer part of the export
+        for url, entry in stale_files.items():
+            if url not in files:
+                self._remove_response(entry)
+                result.removed += 1
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "generatedAt": datetime.now(timezone.utc).isoformat(),
+            "files": files,
+            "articles": fingerprints,
+        }
+        _write_atomic(
+            self._manifest_path,
+            json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"),
+        )
+
+        return result
@@ -0,0 +1,153 @@
+"""
+Prefix index for search-box autocompletion.
+
+Terms are normalized title words and tags, kept in one sorted array so a
+prefix lookup is two bisections. Any prefix whose range holds more than
+MAX_SCAN_TERMS terms has its ranking precomputed at build time, so no lookup
+ever ranks more than MAX_SCAN_TERMS terms.
+
+The index is rebuilt from scratch when the snapshot changes rather than
+updated in place. Inserting a term would shift the sorted array and re-rank
+every precomputed ancestor prefix, which costs about as much as a rebuild.
+"""
+import bisect
+import heapq
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+
+from app.models import Article
+from app.services.article_index import normalize_tag
+
+# Title words shorter than this are not worth suggesting
+MIN_WORD_LENGTH = 2
+
+# Prefixes matching more terms than this get their rankings precomputed
+MAX_SCAN_TERMS = 256
+
+# Maximum number of suggestions a single lookup can return
+MAX_SUGGESTIONS = 20
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Sorts after every other character, for the upper bound of a prefix range
+_MAX_CHAR = chr(0x10FFFF)
+
+
+@dataclass
+class TermStats:
+    """
+    Aggregated statistics for a single suggestion term.
+    """
+
+    text: str
+    kind: str
+    count: int
+    latest: datetime
+
+
+def _rank_key(stats: TermStats) -> tuple[int, float, str]:
+    """
+    Sort key ranking terms by frequency, then recency, then text.
+    """
+    return (-stats.count, -stats.latest.timestamp(), stats.text)
+
+
+class SuggestIndex:
+    """
+    Sorted-array prefix index over normalized title words and tags.
+    """
+
+    def __init__(self, articles: Iterable[Article]) -> None:
+        """
+        Build the index from a snapshot of articles.
+
+        Args:
+            articles: The articles whose titles and tags should be suggested.
+        """
+        stats: dict[tuple[str, str], TermStats] = {}
+
+        for article in articles:
+            terms: dict[tuple[str, str], str] = {}
+            for word in _WORD_PATTERN.findall(article.title.casefold()):
+                if len(word) >= MIN_WORD_LENGTH:
+                    terms.setdefault((word, "word"), word)
+            for tag in article.tags:
+                terms.setdefault((normalize_tag(tag), "tag"), tag)
+
+            # Each article counts once per term
+            for key, text in terms.items():
+                current = stats.get(key)
+                if current is None:
+                    stats[key] = TermStats(
+                        text=text,
+                        kind=key[1],
+                        count=1,
+                        latest=article.publishedAt,
+                    )
+                else:
+                    current.count += 1
+                    if article.publishedAt > current.latest:
+                        current.latest = article.publishedAt
+
+        self._keys: list[tuple[str, str]] = sorted(stats)
+        self._stats: list[TermStats] = [stats[key] for key in self._keys]
+
+        self._precomputed: dict[str, list[TermStats]] = {}
+        self._precompute_rankings()
+
+    def _precompute_rankings(self) -> None:
+        """
+        Store the top terms of every prefix that matches too many terms to scan.
+
+        Walks the prefix tree implied by the sorted keys, descending only into
+        prefixes whose range is still larger than MAX_SCAN_TERMS.
+        """
+        stack: list[tuple[str, int, int]] = [("", 0, len(self._keys))]
+        while stack:
+            prefix, lo, hi = stack.pop()
+            if hi - lo <= MAX_SCAN_TERMS:
+                continue
+            if prefix:
+                self._precomputed[prefix] = heapq.nsmallest(
+                    MAX_SUGGESTIONS, self._stats[lo:hi], key=_rank_key
+                )
+
+            # Terms equal to the prefix sort first and have no longer prefix
+            depth = len(prefix)
+            start = lo
+            while start < hi and len(self._keys[start][0]) == depth:
+                start += 1
+            while start < hi:
+                child = prefix + self._keys[start][0][depth]
+                end = bisect.bisect_left(
+                    self._keys, (child + _MAX_CHAR,), lo=start, hi=hi
+                )
+                stack.append((child, start, end))
+                start = end
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[TermStats]:
+        """
+        Get the top-ranked terms starting with a prefix.
+
+        Args:
+            prefix: The text typed so far.
+            limit: Maximum number of suggestions (capped at MAX_SUGGESTIONS).
+
+        Returns:
+            Matching terms ranked by frequency, then recency.
+        """
+        normalized = " ".join(prefix.casefold().split())
+        if not normalized:
+            return []
+        limit = min(limit, MAX_SUGGESTIONS)
+
+        lo = bisect.bisect_left(self._keys, (normalized,))
+        hi = bisect.bisect_left(self._keys, (normalized + _MAX_CHAR,), lo=lo)
+        if hi - lo > MAX_SCAN_TERMS:
+            return self._precomputed[normalized][:limit]
+        return heapq.nsmallest(limit, self._stats[lo:hi], key=_rank_key)
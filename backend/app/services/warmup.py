@@ -0,0 +1,73 @@
+"""
+Startup warm-up so a new worker pays its cold-start cost before serving traffic.
+"""
+import logging
+import time
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.services.article_service import ArticleService
+from app.services.response_cache import get_response_cache
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupReport(BaseModel):
+    """
+    Outcome of the startup warm-up.
+    """
+
+    ready: bool = Field(..., description="Whether warm-up completed successfully")
+    snapshot_version: Optional[str] = Field(
+        None, description="Content hash of the loaded article snapshot"
+    )
+    article_count: int = Field(0, ge=0, description="Number of loaded articles")
+    timings_ms: dict[str, float] = Field(
+        default_factory=dict, description="Duration of each warm-up phase"
+    )
+    error: Optional[str] = Field(None, description="Warm-up failure, if any")
+
+
+def warm_up(service: ArticleService) -> WarmupReport:
+    """
+    Load the snapshot, build all indexes and fill the hot response cache.
+
+    Failures are logged and reported instead of raised, so the worker can
+    still answer liveness checks while reporting itself as not ready.
+
+    Args:
+        service: The article service to warm up.
+
+    Returns:
+        WarmupReport with the snapshot version and per-phase timings.
+    """
+    started = time.perf_counter()
+    try:
+        service.get_all_articles()
+        timings = service.get_load_timings()
+
+        prerender_started = time.perf_counter()
+        get_response_cache().fill(service)
+        timings["prerender"] = (time.perf_counter() - prerender_started) * 1000
+    except Exception as exc:
+        logger.error(f"Warm-up failed: {exc}", exc_info=True)
+        return WarmupReport(
+            ready=False,
+            timings_ms={"total": (time.perf_counter() - started) * 1000},
+            error=str(exc),
+        )
+
+    timings["total"] = (time.perf_counter() - started) * 1000
+    cache_info = service.get_cache_info()
+    report = WarmupReport(
+        ready=True,
+        snapshot_version=cache_info["snapshot_version"],
+        article_count=cache_info["article_count"],
+        timings_ms=timings,
+    )
+    logger.info(
+        f"Warm-up complete in {timings['total']:.1f} ms "
+        f"({report.article_count} articles, snapshot {report.snapshot_version})"
+    )
+    return report
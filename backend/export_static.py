@@ -0,0 +1,50 @@
+"""
+Export hot API responses as static files for CDN or static server hosting.
+
+Usage:
+    uv run python export_static.py [--output DIR] [--full]
+"""
+import argparse
+import logging
+from pathlib import Path
+
+from app.config import settings
+from app.services import get_article_service
+from app.services.static_export import StaticExporter
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """
+    Run a static export with options from the command line.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(settings.STATIC_EXPORT_DIR),
+        help=f"Output directory (default: {settings.STATIC_EXPORT_DIR})",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=(
+            "Rewrite every file even if unchanged; the previous manifest is "
+            "still used to remove stale files"
+        ),
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.LOG_LEVEL.upper())
+
+    exporter = StaticExporter(get_article_service(), args.output)
+    result = exporter.export(full=args.full)
+    logger.info(
+        f"Exported to {args.output}: {result.written} written, "
+        f"{result.unchanged} unchanged, {result.removed} removed"
+    )
+
+
+if __name__ == "__main__":
+    main()
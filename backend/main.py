@@ -1,14 +1,65 @@
 """
 FastAPI application entry point.
 """
-from fastapi import FastAPI
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 
+from app.admission import (
+    RouteClassStats,
+    get_admission_controller,
+    init_admission_control,
+)
 from app.config import settings
 from app.cors import init_cors
 from app.middleware import configure_error_handlers
 from app.routes import api
+from app.services import (
+    EventStreamStats,
+    WarmupReport,
+    get_article_broadcaster,
+    get_article_service,
+    warm_up,
+    watch_snapshot,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Warm up the worker and run background tasks for the application lifetime.
+
+    The warm-up runs before the server starts accepting connections, so the
+    first request never pays for loading the snapshot or building indexes.
+    Afterwards the snapshot watcher reloads changed article data and publishes
+    new articles to event stream subscribers.
+    """
+    app.state.warmup = None
+    if settings.WARMUP_ENABLED:
+        app.state.warmup = warm_up(get_article_service())
+
+    watcher = None
+    if settings.SNAPSHOT_RELOAD_INTERVAL > 0:
+        watcher = asyncio.create_task(
+            watch_snapshot(
+                get_article_service(),
+                get_article_broadcaster(),
+                interval=settings.SNAPSHOT_RELOAD_INTERVAL,
+            )
+        )
+
+    yield
+
+    if watcher is not None:
+        watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watcher
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -16,20 +67,29 @@ app = FastAPI(
     description="API for the cursor monorepo project",
     version="0.1.0",
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # Configure middleware (order matters!)
-# 1. CORS - must be first to handle preflight requests
+# Each add_middleware call wraps everything added before it, so the last one
+# added is the outermost: compression -> CORS -> admission control -> routes.
+# 1. Admission control - innermost, so shed 503 responses still pass through
+#    CORS and compression on their way out
+init_admission_control(app)
+
+# 2. CORS - wraps admission control, so preflight requests are answered here
+#    and never queue for a slot
 init_cors(app)
 
-# 2. Compression - compress responses before sending
+# 3. Compression - outermost, compresses every response including 503s
 if settings.ENABLE_COMPRESSION:
     app.add_middleware(
         GZipMiddleware,
         minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
     )
 
-# 3. Error handlers - catch and format exceptions
+# 4. Error handlers - exception handlers rather than middleware, they format
+#    errors raised by the routes
 configure_error_handlers(app)
 
 # Include API routes
@@ -50,6 +110,15 @@ class HealthResponse(BaseModel):
     environment: str
 
 
+class ReadinessResponse(BaseModel):
+    """Response model for readiness check endpoint."""
+
+    status: str
+    snapshot_version: Optional[str]
+    article_count: int
+    warmup: Optional[WarmupReport]
+
+
 @app.get("/", response_model=MessageResponse)
 async def root() -> MessageResponse:
     """
@@ -72,6 +141,66 @@ async def health() -> HealthResponse:
     return HealthResponse(status="ok", environment=settings.ENV)
 
 
+@app.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse}},
+)
+async def ready(request: Request, response: Response) -> ReadinessResponse:
+    """
+    Readiness check for load balancers and rolling deploys.
+    
+    Unlike `/health`, this returns 503 until the article snapshot is loaded
+    and indexed, and reports the live snapshot version. A failed warm-up is
+    reported as "failed" until a later load succeeds.
+    
+    Returns:
+        ReadinessResponse with snapshot version and warm-up timings.
+    """
+    report: Optional[WarmupReport] = getattr(request.app.state, "warmup", None)
+    cache_info = get_article_service().get_cache_info()
+
+    if cache_info["snapshot_version"] is not None:
+        ready_status = "ready"
+    elif report is not None and not report.ready:
+        ready_status = "failed"
+    else:
+        ready_status = "not_loaded"
+
+    if ready_status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return ReadinessResponse(
+        status=ready_status,
+        snapshot_version=cache_info["snapshot_version"],
+        article_count=cache_info["article_count"],
+        warmup=report,
+    )
+
+
+@app.get("/health/admission", response_model=dict[str, RouteClassStats])
+async def admission_stats() -> dict[str, RouteClassStats]:
+    """
+    Admission control counters per route class, including shed requests.
+    
+    Returns:
+        Mapping of route class to its limit, in-flight, waiting, admitted
+        and shed counts.
+    """
+    return get_admission_controller().get_stats()
+
+
+@app.get("/health/events", response_model=EventStreamStats)
+async def event_stream_stats() -> EventStreamStats:
+    """
+    Event stream counters, including clients evicted for falling behind.
+    
+    Returns:
+        EventStreamStats with subscriber and eviction counts.
+    """
+    return get_article_broadcaster().get_stats()
+
+
 if __name__ == "__main__":
     import uvicorn
 